@@ -2,8 +2,9 @@
 Configuration & environment variables for Scheme Saathi backend.
 """
 
+from functools import cached_property
 from pathlib import Path
-from typing import List
+from typing import Tuple
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -48,11 +49,12 @@ class Settings(BaseSettings):
     # RAG Settings
     TOP_K_SCHEMES: int = 10  # Number of schemes to retrieve
     SIMILARITY_THRESHOLD: float = 0.3  # Minimum similarity score (0-1)
+    RAG_MAX_CONCURRENCY: int = 32  # Concurrent RAG searches (query embedding is a network call)
 
-    @property
-    def allowed_origins_list(self) -> List[str]:
-        """Convert comma-separated CORS origins to list"""
-        return [origin.strip() for origin in self.ALLOWED_ORIGINS.split(",") if origin.strip()]
+    @cached_property
+    def allowed_origins_list(self) -> Tuple[str, ...]:
+        """Comma-separated CORS origins as a tuple (parsed once per Settings instance)"""
+        return tuple(origin.strip() for origin in self.ALLOWED_ORIGINS.split(",") if origin.strip())
 
     def get_schemes_path(self, base_dir: Path) -> Path:
         """Resolve schemes JSON path relative to backend root."""
@@ -6,17 +6,22 @@ Comprehensive context extraction + multi-dimensional scheme filtering.
 import logging
 import re
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache, partial
+from itertools import islice
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
 
-from fastapi import FastAPI, HTTPException
-from fastapi.middleware.cors import CORSMiddleware
+import anyio
+from fastapi import FastAPI, HTTPException, Request, Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.config import settings
 from app.models import (
+    CategoryListResponse,
     ChatMessage,
     ChatRequest,
     ChatResponse,
     HealthResponse,
+    SchemeListResponse,
     SchemeSearchRequest,
     SchemeSearchResponse,
 )
@@ -35,13 +40,81 @@ app = FastAPI(
     description="AI-powered government scheme discovery for Indian citizens",
 )
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=False,
-    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-    allow_headers=["*"],
-)
+class OpenCORSMiddleware:
+    """
+    CORS for a public, credential-less API: any origin, fixed methods, any
+    header. Same responses as CORSMiddleware(allow_origins=["*"]), but the
+    headers are constant byte pairs and preflights are answered directly.
+    """
+
+    ALLOW_ORIGIN = (b"access-control-allow-origin", b"*")
+    ALLOW_METHODS = frozenset((b"GET", b"POST", b"PUT", b"DELETE", b"OPTIONS"))
+    PREFLIGHT_HEADERS = [
+        ALLOW_ORIGIN,
+        (b"access-control-allow-methods", b"GET, POST, PUT, DELETE, OPTIONS"),
+        (b"access-control-max-age", b"600"),
+        (b"content-type", b"text/plain; charset=utf-8"),
+        (b"vary", b"Origin, Access-Control-Request-Method, Access-Control-Request-Headers, "
+                  b"Access-Control-Request-Private-Network"),
+    ]
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = requested_method = requested_headers = None
+        private_network = False
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                requested_method = value
+            elif name == b"access-control-request-headers":
+                requested_headers = value
+            elif name == b"access-control-request-private-network":
+                private_network = True
+
+        if origin is not None and requested_method is not None and scope["method"] == "OPTIONS":
+            failures = [
+                failure for failure, failed in (
+                    (b"method", requested_method not in self.ALLOW_METHODS),
+                    (b"private-network", private_network),
+                ) if failed
+            ]
+            if failures:
+                status, body = 400, b"Disallowed CORS " + b", ".join(failures)
+            else:
+                status, body = 200, b"OK"
+            headers = [*self.PREFLIGHT_HEADERS, (b"content-length", str(len(body)).encode())]
+            if requested_headers is not None:
+                headers.append((b"access-control-allow-headers", requested_headers))
+            await send({"type": "http.response.start", "status": status, "headers": headers})
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        # Every response varies by Origin; the allow header only goes to CORS requests
+        extra = [self.ALLOW_ORIGIN] if origin is not None else []
+
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = []
+                vary = [b"Origin"]
+                for name, value in message.get("headers", ()):
+                    if name.lower() == b"vary":
+                        vary.insert(-1, value)
+                    else:
+                        headers.append((name, value))
+                message["headers"] = [*headers, *extra, (b"vary", b", ".join(vary))]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+
+app.add_middleware(OpenCORSMiddleware)
 
 
 # ============================================================
@@ -50,7 +123,7 @@ app.add_middleware(
 #    Zero API calls. ~1ms per message.
 # ============================================================
 
-INDIAN_STATES = [
+INDIAN_STATES = (
     "andhra pradesh", "arunachal pradesh", "assam", "bihar", "chhattisgarh",
     "goa", "gujarat", "haryana", "himachal pradesh", "jharkhand", "karnataka",
     "kerala", "madhya pradesh", "maharashtra", "manipur", "meghalaya",
@@ -58,7 +131,7 @@ INDIAN_STATES = [
     "tamil nadu", "telangana", "tripura", "uttar pradesh", "uttarakhand",
     "west bengal", "delhi", "jammu and kashmir", "ladakh", "chandigarh",
     "puducherry", "andaman and nicobar",
-]
+)
 
 STATE_DISPLAY = {s: s.title() for s in INDIAN_STATES}
 STATE_DISPLAY.update({
@@ -166,7 +239,7 @@ NEED_PATTERNS = {
     # Marriage / wedding
     r"\bmarriage\b|\bwedding\b|\bshadi\b|\bvivah\b|\bdowry\b|\bkanyadan\b|\bkanya\b": "marriage",
     # Financial help / money / cash
-    r"\bmoney\b|\bcash\b|\bfinancial\s+help\b|\bfinancial\s+assist\b|\bpaisa\b|\barthik\b|\bdirect\s+benefit\b|\bDBT\b": "financial_assistance",
+    r"\bmoney\b|\bcash\b|\bfinancial\s+help\b|\bfinancial\s+assist\b|\bpaisa\b|\barthik\b|\bdirect\s+benefit\b|\bdbt\b": "financial_assistance",
     # Subsidy / grant
     r"\bsubsidy\b|\bgrant\b|\brebate\b|\bconcession\b": "subsidy",
     # Legal / protection
@@ -174,124 +247,279 @@ NEED_PATTERNS = {
     # Food / nutrition
     r"\bfood\b|\bration\b|\bnutrition\b|\bmeal\b|\bmid[- ]?day\b|\bannapurna\b": "food_nutrition",
     # Disability
-    r"\bdisability\b|\bdivyang\b|\bhandicap\b|\bblind\b|\bdeaf\b|\bPWD\b": "disability_support",
+    r"\bdisability\b|\bdivyang\b|\bhandicap\b|\bblind\b|\bdeaf\b|\bpwd\b": "disability_support",
     # Generic insurance (catch-all for "insurance" not matched above)
     r"\binsurance\b": "health_insurance",
 }
 
 # Required context fields before recommending
 # Order = question order. "help_type" = what kind of help they want
-CONTEXT_FIELDS = ["occupation", "state", "help_type", "gender", "age", "caste_category"]
+CONTEXT_FIELDS = ("occupation", "state", "help_type", "gender", "age", "caste_category")
+CONTEXT_FIELDS_SET = frozenset(CONTEXT_FIELDS)
 MIN_CONTEXT_FOR_RECOMMENDATION = 4
 
 
+# --- Compiled pattern tables ---
+# Everything extract_context_from_text matches is compiled once here. Table
+# rows also carry the literals they start with, so a row whose keywords are
+# absent from the message is rejected by substring tests without running the
+# regex (see _Rule).
+
+_REGEX_META = frozenset("\\()[]{}?*+.|^$")
+
+
+def _split_alternatives(pattern: str) -> List[str]:
+    """Split a pattern on its top-level "|" (not inside groups or classes)."""
+    parts, current, depth, i = [], [], 0, 0
+    while i < len(pattern):
+        ch = pattern[i]
+        if ch == "\\":
+            current.append(pattern[i:i + 2])
+            i += 2
+            continue
+        if ch in "([":
+            depth += 1
+        elif ch in ")]":
+            depth -= 1
+        if ch == "|" and depth == 0:
+            parts.append("".join(current))
+            current = []
+        else:
+            current.append(ch)
+        i += 1
+    parts.append("".join(current))
+    return parts
+
+
+def _leading_literals(pattern: str) -> Optional[Tuple[str, ...]]:
+    """
+    Literal prefix each alternative of pattern must start with, lowercased,
+    e.g. r"\bstudents?\b|\bclass\s+\d" -> ("student", "class").
+    None when some alternative has no literal prefix (no cheap pre-check).
+    """
+    literals = []
+    for alt in _split_alternatives(pattern):
+        if alt.startswith("\\b"):
+            alt = alt[2:]
+        prefix = []
+        for ch in alt:
+            if ch in _REGEX_META:
+                if ch in "?*{" and prefix:
+                    prefix.pop()  # the quantified character is optional
+                break
+            prefix.append(ch)
+        if not prefix:
+            return None
+        literals.append("".join(prefix).lower())
+    return tuple(dict.fromkeys(literals))
+
+
+class _Rule:
+    """
+    A compiled pattern with a substring pre-check. Texts are lowercased
+    before matching (patterns are written in lowercase, so no re.I), and
+    when none of the pattern's leading literals occurs in the text (a
+    C-speed "in" test) the regex cannot match and is skipped.
+    Patterns that start with a group/class can name a required literal.
+    """
+
+    __slots__ = ("literals", "pattern")
+
+    def __init__(self, pattern: str, literals: Optional[Tuple[str, ...]] = None):
+        self.literals = literals or _leading_literals(pattern)
+        self.pattern = re.compile(pattern)
+
+    def search(self, text: str) -> Optional[re.Match]:
+        if self.literals is None:
+            return self.pattern.search(text)
+        # Plain loop rather than any(genexpr): no generator frame per call
+        for lit in self.literals:
+            if lit in text:
+                return self.pattern.search(text)
+        return None
+
+
+def _compile_table(table: Dict[str, str]) -> Tuple[Tuple[_Rule, str], ...]:
+    """Compile a {pattern: value} table, keeping its priority order."""
+    return tuple((_Rule(pattern), value) for pattern, value in table.items())
+
+
+def _compile_list(patterns: List[str]) -> Tuple[_Rule, ...]:
+    return tuple(_Rule(pattern) for pattern in patterns)
+
+
+STATES_BY_LENGTH = tuple(sorted(INDIAN_STATES, key=len, reverse=True))
+# (name, whole-word pattern, display name), longest name first. The plain
+# substring test rejects most messages cheaply; the pattern then stops
+# "goa" matching inside "goal" while still accepting demonyms such as
+# "punjabi", "goan" and "assamese".
+_STATE_RES = tuple(
+    (state, re.compile(r"\b" + re.escape(state) + r"(?:i|n|ese)?\b"), STATE_DISPLAY.get(state, state.title()))
+    for state in STATES_BY_LENGTH
+)
+
+_OCCUPATION_RES = _compile_table(OCCUPATIONS)
+_GENDER_RES = _compile_table(GENDERS)
+_CATEGORY_RES = _compile_table(CATEGORIES)
+_AGE_RES = (
+    _Rule(r"\b(\d{1,2})\s*(?:years?|yrs?|year)?\s*old\b", literals=("old",)),
+    _Rule(r"\bage\s*(?:is\s*)?(\d{1,2})\b"),
+    _Rule(r"\bi(?:'?m| am)\s*(\d{1,2})\b", literals=("im", "i'm", "i am")),
+)
+_DIGIT_RE = re.compile(r"\d")
+_INCOME_RE = _Rule(
+    r"(?:income|earn|salary|annual\s+income).{0,25}?([\d,.]+)\s*(?:lakh|lac|lpa|per\s*(?:annum|year|month)|/\s*(?:year|month|annum))",
+    literals=("income", "earn", "salary"),
+)
+# Any hit sets the level, so each education list is one alternation. The
+# keyed tables stay row by row: with the literal pre-check that is cheaper
+# than one alternation, which Python's re retries branch by branch at every
+# position.
+_EDUCATION_HIGHER_RE = _Rule("|".join(EDUCATION_HIGHER_PATTERNS))
+_EDUCATION_SCHOOL_RE = _Rule("|".join(EDUCATION_SCHOOL_PATTERNS))
+_BPL_RES = _compile_list(BPL_PATTERNS)
+_DISABILITY_RES = _compile_list(DISABILITY_PATTERNS)
+_RESIDENCE_RES = _compile_table(RESIDENCE_PATTERNS)
+_MARITAL_RES = _compile_table(MARITAL_PATTERNS)
+_NEED_RES = _compile_table(NEED_PATTERNS)
+
+_NEGATION_PREFIX = r"(?:not|no|neither|don'?t|isn'?t|i'?m not)\s+(?:a\s+)?"
+# category -> "not <category>" pattern. The category's alternatives are grouped
+# so the negation applies to each of them, not just the first.
+_NEGATED_CATEGORY_RES = {
+    cat: re.compile(f"{_NEGATION_PREFIX}(?:{pattern})") for pattern, cat in CATEGORIES.items()
+}
+_NEGATED_DISABILITY_RE = re.compile(r"(?:not|no|don'?t have)\s+(?:a\s+)?(?:disabl|handicap|pwd|divyang)")
+_NEGATED_BPL_RE = re.compile(r"(?:not|no)\s+(?:bpl|below poverty|ews|poor|economically weak)")
+
+
 def extract_context_from_text(text: str) -> Dict[str, str]:
     """Extract every possible user attribute from a single message."""
+    return dict(_extract_context(text))
+
+
+# Longer messages are extracted uncached, so anonymous clients can't pin large
+# strings in the cache.
+_EXTRACT_CACHE_MAX_LEN = 1000
+
+
+def _extract_context(text: str) -> Tuple[Tuple[str, str], ...]:
+    """Extraction frozen to (field, value) pairs, cached for short messages.
+
+    Past messages are replayed on every /chat turn, so most calls are repeats.
+    """
+    if len(text) > _EXTRACT_CACHE_MAX_LEN:
+        return _extract_pairs(text)
+    return _extract_pairs_cached(text)
+
+
+def _extract_pairs(text: str) -> Tuple[Tuple[str, str], ...]:
     ctx: Dict[str, str] = {}
     t = text.lower()
 
     # --- State ---
-    for state in sorted(INDIAN_STATES, key=len, reverse=True):
-        if state in t:
-            ctx["state"] = STATE_DISPLAY.get(state, state.title())
+    for state, pattern, display in _STATE_RES:
+        if state in t and pattern.search(t):
+            ctx["state"] = display
             break
 
     # --- Occupation ---
-    for pattern, occ in OCCUPATIONS.items():
-        if re.search(pattern, t, re.I):
+    for pattern, occ in _OCCUPATION_RES:
+        if pattern.search(t):
             ctx["occupation"] = occ
             break
 
     # --- Gender ---
-    for pattern, g in GENDERS.items():
-        if re.search(pattern, t, re.I):
+    for pattern, g in _GENDER_RES:
+        if pattern.search(t):
             ctx["gender"] = g
             break
 
     # --- Caste / category ---
-    for pattern, cat in CATEGORIES.items():
-        if re.search(pattern, t, re.I):
+    for pattern, cat in _CATEGORY_RES:
+        if pattern.search(t):
             ctx["caste_category"] = cat
             break
 
-    # --- Age ---
-    for pat in [
-        r"\b(\d{1,2})\s*(?:years?|yrs?|year)?\s*old\b",
-        r"\bage\s*(?:is\s*)?(\d{1,2})\b",
-        r"\bi(?:'?m| am)\s*(\d{1,2})\b",
-    ]:
-        m = re.search(pat, t, re.I)
-        if m:
-            age = int(m.group(1))
-            if 5 <= age <= 100:
-                ctx["age"] = str(age)
-            break
+    # Age and income both need a number; most messages have none
+    if _DIGIT_RE.search(t):
+        # --- Age ---
+        for pat in _AGE_RES:
+            m = pat.search(t)
+            if m:
+                age = int(m.group(1))
+                if 5 <= age <= 100:
+                    ctx["age"] = str(age)
+                break
 
-    # --- Income ---
-    m = re.search(
-        r"(?:income|earn|salary|annual\s+income).{0,25}?([\d,.]+)\s*(?:lakh|lac|lpa|per\s*(?:annum|year|month)|/\s*(?:year|month|annum))",
-        t, re.I,
-    )
-    if m:
-        ctx["income"] = m.group(0).strip()
+        # --- Income ---
+        m = _INCOME_RE.search(t)
+        if m:
+            ctx["income"] = m.group(0).strip()
 
     # --- Education level ---
-    for pat in EDUCATION_HIGHER_PATTERNS:
-        if re.search(pat, t, re.I):
-            ctx["education_level"] = "higher"
-            break
-    if "education_level" not in ctx:
-        for pat in EDUCATION_SCHOOL_PATTERNS:
-            if re.search(pat, t, re.I):
-                ctx["education_level"] = "school"
-                break
+    if _EDUCATION_HIGHER_RE.search(t):
+        ctx["education_level"] = "higher"
+    elif _EDUCATION_SCHOOL_RE.search(t):
+        ctx["education_level"] = "school"
 
     # --- BPL / EWS ---
-    for pat in BPL_PATTERNS:
-        if re.search(pat, t, re.I):
+    for pat in _BPL_RES:
+        if pat.search(t):
             ctx["bpl"] = "yes"
             break
 
     # --- Disability ---
-    for pat in DISABILITY_PATTERNS:
-        if re.search(pat, t, re.I):
+    for pat in _DISABILITY_RES:
+        if pat.search(t):
             ctx["disability"] = "yes"
             break
 
     # --- Rural / Urban ---
-    for pat, val in RESIDENCE_PATTERNS.items():
-        if re.search(pat, t, re.I):
+    for pat, val in _RESIDENCE_RES:
+        if pat.search(t):
             ctx["residence"] = val
             break
 
     # --- Marital / special family status ---
-    for pat, val in MARITAL_PATTERNS.items():
-        if re.search(pat, t, re.I):
+    for pat, val in _MARITAL_RES:
+        if pat.search(t):
             ctx["family_status"] = val
             break
 
     # --- Specific need / type of help ---
-    for pat, need in NEED_PATTERNS.items():
-        if re.search(pat, t, re.I):
+    for pat, need in _NEED_RES:
+        if pat.search(t):
             ctx["specific_need"] = need
             ctx["help_type"] = need  # Also track as help_type for question flow
             break
 
     # --- Negations ---
-    for pattern, cat in CATEGORIES.items():
-        neg = re.search(r"(?:not|no|neither|don'?t|isn'?t|i'?m not)\s+(?:a\s+)?" + pattern, t, re.I)
-        if neg and ctx.get("caste_category") == cat:
-            del ctx["caste_category"]
+    # Only the detected category can be negated away
+    if "caste_category" in ctx and _NEGATED_CATEGORY_RES[ctx["caste_category"]].search(t):
+        del ctx["caste_category"]
 
-    neg_dis = re.search(r"(?:not|no|don'?t have)\s+(?:a\s+)?(?:disabl|handicap|pwd|divyang)", t, re.I)
-    if neg_dis and "disability" in ctx:
+    if "disability" in ctx and _NEGATED_DISABILITY_RE.search(t):
         del ctx["disability"]
 
-    neg_bpl = re.search(r"(?:not|no)\s+(?:bpl|below poverty|ews|poor|economically weak)", t, re.I)
-    if neg_bpl and "bpl" in ctx:
+    if "bpl" in ctx and _NEGATED_BPL_RE.search(t):
         del ctx["bpl"]
 
-    return ctx
+    return tuple(ctx.items())
+
+
+_extract_pairs_cached = lru_cache(maxsize=4096)(_extract_pairs)
+
+
+def _normalize_history(history: Optional[List[Any]]) -> List[Tuple[str, str]]:
+    """(role, content) for each message, whether ChatMessage objects or dicts."""
+    turns: List[Tuple[str, str]] = []
+    for msg in history or []:
+        if isinstance(msg, dict):
+            turns.append((msg.get("role") or "", msg.get("content") or ""))
+        else:
+            turns.append((getattr(msg, "role", None) or "", getattr(msg, "content", None) or ""))
+    return turns
 
 
 def build_cumulative_context(
@@ -299,29 +527,43 @@ def build_cumulative_context(
     current_message: str,
 ) -> Dict[str, str]:
     """Walk entire conversation building user context. Later messages override."""
-    ctx: Dict[str, str] = {}
-    for msg in (history or []):
-        role = getattr(msg, "role", None) or (msg.get("role") if isinstance(msg, dict) else None)
-        content = getattr(msg, "content", None) or (msg.get("content", "") if isinstance(msg, dict) else "")
-        if role == "user" and content:
-            ctx.update(extract_context_from_text(content))
-    ctx.update(extract_context_from_text(current_message))
+    return _context_from_turns(_normalize_history(history), current_message)
+
+
+def _context_from_turns(turns: List[Tuple[str, str]], current_message: str) -> Dict[str, str]:
+    """
+    build_cumulative_context over already normalized (role, content) turns.
+    Walks newest-first, so older messages only fill fields that are still
+    missing. A repeated message ("yes", "ok") adds nothing its newer copy did
+    not, so it is skipped.
+    """
+    ctx: Dict[str, str] = dict(_extract_context(current_message))
+    seen = {current_message}
+    for role, content in reversed(turns):
+        if role == "user" and content and content not in seen:
+            seen.add(content)
+            for key, value in _extract_context(content):
+                ctx.setdefault(key, value)
     return ctx
 
 
 def context_completeness(ctx: Dict[str, str]) -> int:
-    return sum(1 for f in CONTEXT_FIELDS if ctx.get(f))
+    return sum(1 for f in ctx.keys() & CONTEXT_FIELDS_SET if ctx[f])
 
 
 def missing_context_fields(ctx: Dict[str, str]) -> List[str]:
     return [f for f in CONTEXT_FIELDS if not ctx.get(f)]
 
 
+# Context values that carry no information
+UNKNOWN_VALUES = frozenset({"unknown", "any", "all india", ""})
+
+
 def _is_valid(val: Optional[str]) -> bool:
     """Return True if a context value is present and meaningful."""
     if not val:
         return False
-    return val.strip().lower() not in ("unknown", "any", "all india", "")
+    return val.strip().lower() not in UNKNOWN_VALUES
 
 
 def has_enough_context(user_context: Optional[Dict[str, str]]) -> bool:
@@ -364,19 +606,132 @@ def _get_elig(scheme: dict) -> dict:
     return elig if isinstance(elig, dict) else {}
 
 
-def _scheme_text(scheme: dict) -> str:
-    """Combine name + brief + eligibility text for keyword searching."""
-    name = (scheme.get("scheme_name") or "")
-    brief = (scheme.get("brief_description") or "")
-    elig = _get_elig(scheme)
-    raw = (elig.get("raw_eligibility_text") or "")
-    return f"{name} {brief} {raw}".lower()
+class SchemeFacts(NamedTuple):
+    """Normalized scheme fields and flags the filters read, derived once per scheme."""
+
+    text: str
+    state: str
+    gender: str
+    caste: str
+    age_range: Optional[Tuple[int, int]]
+    occupation: str
+    benefit_type: str
+    education_level: str
+    # AUDIENCE_* bits from the scheme name, for the name-based filters
+    audience: int
+
+
+# scheme_id -> SchemeFacts. Catalogue schemes never change after load, so the
+# cache is filled once (warmed at startup) and shared by every request.
+_SCHEME_FACTS: Dict[str, SchemeFacts] = {}
+
+
+def _scheme_facts(scheme: dict) -> SchemeFacts:
+    """Cached by scheme_id; schemes without one are derived on every call."""
+    scheme_id = scheme.get("scheme_id")
+    facts = _SCHEME_FACTS.get(scheme_id) if scheme_id else None
+    if facts is None:
+        elig = _get_elig(scheme)
+        benefits = scheme.get("benefits") or {}
+        name = (scheme.get("scheme_name") or "").lower()
+        brief = (scheme.get("brief_description") or "").lower()
+        # name + brief + eligibility text, for keyword searching
+        text = f"{name} {brief} {(elig.get('raw_eligibility_text') or '').lower()}"
+        facts = SchemeFacts(
+            text=text,
+            state=(elig.get("state") or "").strip().lower(),
+            gender=(elig.get("gender") or "any").strip().lower(),
+            caste=(elig.get("caste_category") or "any").strip().lower(),
+            age_range=_parse_age_range(elig.get("age_range") or "any"),
+            occupation=(elig.get("occupation") or "any").strip().lower(),
+            benefit_type=(
+                (benefits.get("benefit_type") or "").strip().lower()
+                if isinstance(benefits, dict) else ""
+            ),
+            education_level=_scheme_education_level(text),
+            audience=_scheme_audience(name, brief),
+        )
+        if scheme_id:
+            _SCHEME_FACTS[scheme_id] = facts
+    return facts
+
+
+# Audience bits, in the order the filter chain checks them (the lowest bit set
+# in a rejection decides which reason is logged).
+AUDIENCE_DISABILITY = 1 << 0
+AUDIENCE_WIDOW = 1 << 1
+AUDIENCE_ORPHAN = 1 << 2
+AUDIENCE_FARMER = 1 << 3
+AUDIENCE_SENIOR = 1 << 4
+AUDIENCE_CHILD = 1 << 5
+
+_AUDIENCE_REASONS = {
+    AUDIENCE_DISABILITY: "disability",
+    AUDIENCE_WIDOW: "family_status",
+    AUDIENCE_ORPHAN: "family_status",
+    AUDIENCE_FARMER: "farmer_specific",
+    AUDIENCE_SENIOR: "senior_specific",
+    AUDIENCE_CHILD: "child_specific",
+}
+
+
+def _scheme_audience(name: str, brief: str) -> int:
+    """AUDIENCE_* bits for a lowercased scheme name (and brief)."""
+    audience = 0
+    if _DISABILITY_SCHEME_RE.search(name):
+        audience |= AUDIENCE_DISABILITY
+    if _WIDOW_SCHEME_RE.search(name):
+        audience |= AUDIENCE_WIDOW
+    if _ORPHAN_SCHEME_RE.search(name):
+        audience |= AUDIENCE_ORPHAN
+    if _FARMER_SCHEME_RE.search(name):
+        audience |= AUDIENCE_FARMER
+    if _SENIOR_SCHEME_RE.search(name):
+        audience |= AUDIENCE_SENIOR
+    # Sukanya Samriddhi can be opened by parents, so check brief
+    if _CHILD_SCHEME_RE.search(name) and not ("parent" in brief or "guardian" in brief):
+        audience |= AUDIENCE_CHILD
+    return audience
+
+
+def _audience_reject_mask(
+    user_age: Optional[int],
+    user_occupation: str,
+    user_disability: bool,
+    user_family: Optional[str],
+) -> int:
+    """
+    AUDIENCE_* bits this user must not see: disability schemes unless disabled,
+    widow / orphan schemes for any other stated family status, farmer schemes
+    for other occupations, senior schemes below 55 (unless a senior citizen),
+    child schemes above 25.
+    """
+    mask = 0
+    if not user_disability:
+        mask |= AUDIENCE_DISABILITY
+    if user_family is not None and user_family != "widow":
+        mask |= AUDIENCE_WIDOW
+    if user_family is not None and user_family != "orphan":
+        mask |= AUDIENCE_ORPHAN
+    if user_occupation and user_occupation != "farmer":
+        mask |= AUDIENCE_FARMER
+    if user_occupation != "senior citizen" and not (user_age and user_age >= 55):
+        mask |= AUDIENCE_SENIOR
+    if user_age is not None and user_age > 25:
+        mask |= AUDIENCE_CHILD
+    return mask
 
 
 # --- Filter: State ---
+# The state, gender, caste and occupation checks only depend on (scheme value,
+# user value), and the catalogue has few distinct values per column, so each
+# pair is decided once.
 def _filter_state(scheme: dict, user_state: str) -> bool:
-    elig = _get_elig(scheme)
-    scheme_state = (elig.get("state") or "").strip().lower()
+    return _state_allows(_scheme_facts(scheme).state, user_state)
+
+
+@lru_cache(maxsize=4096)
+def _state_allows(scheme_state: str, user_state: str) -> bool:
     if not scheme_state or scheme_state in ("all india", "any", "all", "nationwide"):
         return True
     # "All India (..." or state contains user_state
@@ -388,8 +743,16 @@ def _filter_state(scheme: dict, user_state: str) -> bool:
 
 # --- Filter: Gender ---
 def _filter_gender(scheme: dict, user_gender: str) -> bool:
-    elig = _get_elig(scheme)
-    sg = (elig.get("gender") or "any").strip().lower()
+    return _gender_allows(_scheme_facts(scheme).gender, user_gender)
+
+
+@lru_cache(maxsize=64)
+def _word_re(word: str) -> "re.Pattern[str]":
+    return re.compile(r"\b" + re.escape(word) + r"\b")
+
+
+@lru_cache(maxsize=1024)
+def _gender_allows(sg: str, user_gender: str) -> bool:
     if sg in ("any", ""):
         return True
     ug = user_gender.lower()
@@ -397,15 +760,21 @@ def _filter_gender(scheme: dict, user_gender: str) -> bool:
     if sg == ug:
         return True
     # Use word boundary check to prevent "male" matching inside "female"
-    if re.search(r"\b" + re.escape(ug) + r"\b", sg):
+    if _word_re(ug).search(sg):
         return True
     return False
 
 
 # --- Filter: Caste / Category ---
+_RESERVED_CATEGORY_RE = re.compile(r"\bsc\b|\bst\b|\bobc\b|\bminority\b")
+
+
 def _filter_caste(scheme: dict, user_caste: str) -> bool:
-    elig = _get_elig(scheme)
-    sc = (elig.get("caste_category") or "any").strip().lower()
+    return _caste_allows(_scheme_facts(scheme).caste, user_caste)
+
+
+@lru_cache(maxsize=4096)
+def _caste_allows(sc: str, user_caste: str) -> bool:
     if sc in ("any", ""):
         return True
     uc = user_caste.lower()
@@ -421,36 +790,40 @@ def _filter_caste(scheme: dict, user_caste: str) -> bool:
     if uc == "sc/st" and ("sc" in sc or "st" in sc):
         return True
     # "general" user should NOT see SC/ST/OBC-only schemes
-    if uc == "general" and re.search(r"\bsc\b|\bst\b|\bobc\b|\bminority\b", sc):
+    if uc == "general" and _RESERVED_CATEGORY_RE.search(sc):
         return False
     return False
 
 
 # --- Filter: Age ---
+_AGE_SPAN_RE = re.compile(r"(\d+)\s*[-–to]+\s*(\d+)")
+_AGE_PLUS_RE = re.compile(r"(\d+)\s*\+")
+_AGE_BELOW_RE = re.compile(r"<\s*(\d+)")
+_AGE_ABOVE_RE = re.compile(r">\s*(\d+)")
+
+
 def _parse_age_range(age_str: str) -> Optional[Tuple[int, int]]:
     """Parse age strings like '18-40', '60+', '<10', '18+' etc."""
     s = age_str.strip().lower()
     if not s or s in ("any", "all", "no limit"):
         return None
-    m = re.search(r"(\d+)\s*[-–to]+\s*(\d+)", s)
+    m = _AGE_SPAN_RE.search(s)
     if m:
         return (int(m.group(1)), int(m.group(2)))
-    m = re.search(r"(\d+)\s*\+", s)
+    m = _AGE_PLUS_RE.search(s)
     if m:
         return (int(m.group(1)), 120)
-    m = re.search(r"<\s*(\d+)", s)
+    m = _AGE_BELOW_RE.search(s)
     if m:
         return (0, int(m.group(1)))
-    m = re.search(r">\s*(\d+)", s)
+    m = _AGE_ABOVE_RE.search(s)
     if m:
         return (int(m.group(1)), 120)
     return None
 
 
 def _filter_age(scheme: dict, user_age: int) -> bool:
-    elig = _get_elig(scheme)
-    age_str = (elig.get("age_range") or "any").strip()
-    rng = _parse_age_range(age_str)
+    rng = _scheme_facts(scheme).age_range
     if rng is None:
         return True
     lo, hi = rng
@@ -459,8 +832,11 @@ def _filter_age(scheme: dict, user_age: int) -> bool:
 
 # --- Filter: Occupation ---
 def _filter_occupation(scheme: dict, user_occupation: str) -> bool:
-    elig = _get_elig(scheme)
-    so = (elig.get("occupation") or "any").strip().lower()
+    return _occupation_allows(_scheme_facts(scheme).occupation, user_occupation)
+
+
+@lru_cache(maxsize=4096)
+def _occupation_allows(so: str, user_occupation: str) -> bool:
     if so in ("any", ""):
         return True
     uo = user_occupation.lower()
@@ -483,99 +859,62 @@ def _filter_occupation(scheme: dict, user_occupation: str) -> bool:
 
 
 # --- Filter: Education level (pre-matric vs post-matric) ---
-def _scheme_is_pre_matric(text: str) -> bool:
-    if re.search(r"\bpre[- ]?matric\b", text):
-        return True
-    # Mentions class 1-10 but NOT class 11-12 / college / post-matric
-    if re.search(r"\bclass(?:es)?\s+(?:[1-9]|10)\b", text):
-        if not re.search(r"\bclass\s*1[1-2]\b|\bpost[- ]?matric\b|\bcollege\b|\buniversity\b|\bdegree\b|\bgraduate\b", text):
-            return True
-    return False
+# One scan tags every education marker in the scheme text:
+#   pre_matric / pre_class → school-level signals
+#   upper / post_core      → also cancel a bare "class 1-10" mention
+#   post_extra             → post-matric only
+_EDUCATION_MARKERS_RE = re.compile(
+    r"(?P<pre_matric>\bpre[- ]?matric\b)"
+    r"|(?P<pre_class>\bclass(?:es)?\s+(?:[1-9]|10)\b)"
+    r"|(?P<upper>\bclass\s*1[1-2]\b)"
+    r"|(?P<post_core>\bpost[- ]?matric\b|\bcollege\b|\buniversity\b|\bdegree\b|\bgraduate\b)"
+    r"|(?P<post_extra>\bprofessional\s+course\b|\bengineering\b|\bmbbs\b|\bdiploma\b)"
+)
 
 
-def _scheme_is_post_matric(text: str) -> bool:
-    return bool(re.search(
-        r"\bpost[- ]?matric\b|\bcollege\b|\buniversity\b|\bdegree\b|\bgraduate\b"
-        r"|\bprofessional\s+course\b|\bengineering\b|\bmbbs\b|\bdiploma\b",
-        text,
-    ))
+def _scheme_education_level(text: str) -> str:
+    """Classify scheme text as "pre", "post", "both" or "none" (matric level)."""
+    found = {m.lastgroup for m in _EDUCATION_MARKERS_RE.finditer(text)}
+    is_post = "post_core" in found or "post_extra" in found
+    # Mentions class 1-10 but NOT class 11-12 / college / post-matric
+    is_pre = "pre_matric" in found or (
+        "pre_class" in found and "upper" not in found and "post_core" not in found
+    )
+    if is_pre:
+        return "both" if is_post else "pre"
+    return "post" if is_post else "none"
 
 
 def _filter_education(scheme: dict, user_edu: str) -> bool:
-    text = _scheme_text(scheme)
-    if user_edu == "higher":
-        return not _scheme_is_pre_matric(text)
-    elif user_edu == "school":
-        return not _scheme_is_post_matric(text)
-    return True
-
-
-# --- Filter: Disability ---
-def _filter_disability(scheme: dict, user_has_disability: bool) -> bool:
-    """If scheme is *only* for disabled people and user is NOT disabled, reject."""
-    text = _scheme_text(scheme)
-    name = (scheme.get("scheme_name") or "").lower()
-    # Schemes with "disability" or "divyang" or "PWD" in the name are disability-specific
-    is_disability_scheme = bool(re.search(
-        r"\bdisabilit\w+\b|\bdivyang\b|\bpwd\b|\bhandicap\w*\b|\bblind\b|\bdeaf\b",
-        name,
-    ))
-    if is_disability_scheme and not user_has_disability:
-        return False
-    return True
-
-
-# --- Filter: Widow / Orphan specific schemes ---
-def _filter_family_status(scheme: dict, user_status: Optional[str]) -> bool:
-    name = (scheme.get("scheme_name") or "").lower()
-    # Widow-only schemes
-    if re.search(r"\bwidow\b|\bvidhwa\b", name) and user_status != "widow":
-        return False
-    # Orphan-only schemes
-    if re.search(r"\borphan\b|\banath\b", name) and user_status != "orphan":
-        return False
-    return True
-
-
-# --- Filter: Farmer-specific land schemes for non-farmers ---
-def _filter_farmer_schemes(scheme: dict, user_occupation: str) -> bool:
-    """Don't show crop insurance / Kisan schemes to non-farmers."""
-    if user_occupation == "farmer":
-        return True
-    name = (scheme.get("scheme_name") or "").lower()
-    if re.search(r"\bkisan\b|\bcrop\b|\bfasal\b|\bkcc\b|\bmandi\b|\be-?nam\b|\bagriculture\b", name):
-        return False
-    return True
-
-
-# --- Filter: Senior citizen schemes for young people ---
-def _filter_senior_schemes(scheme: dict, user_age: Optional[int], user_occupation: str) -> bool:
-    name = (scheme.get("scheme_name") or "").lower()
-    is_senior_scheme = bool(re.search(r"\bold\s*age\b|\bsenior\s*citizen\b|\bvaya\b|\bvridh\b", name))
-    if not is_senior_scheme:
-        return True
-    if user_occupation == "senior citizen":
+    if user_edu not in ("higher", "school"):
         return True
-    if user_age and user_age >= 55:
-        return True
-    return False
-
-
-# --- Filter: Children-only schemes for adults ---
-def _filter_child_schemes(scheme: dict, user_age: Optional[int]) -> bool:
-    name = (scheme.get("scheme_name") or "").lower()
-    brief = (scheme.get("brief_description") or "").lower()
-    # Schemes clearly for children (Sukanya, Beti Bachao, child labor, etc.)
-    is_child_scheme = bool(re.search(
-        r"\bchild\s+labour\b|\bbalika\b|\bbeti\b|\bsukanya\b|\bgirl\s+child\b",
-        name,
-    ))
-    if is_child_scheme and user_age and user_age > 25:
-        # Sukanya Samriddhi can be opened by parents, so check brief
-        if "parent" in brief or "guardian" in brief:
-            return True
-        return False
-    return True
+    level = _scheme_facts(scheme).education_level
+    if user_edu == "higher":
+        return level not in ("pre", "both")
+    return level not in ("post", "both")
+
+
+# --- Audience filters: disability / widow / orphan / farmer / senior / child ---
+# Keyword rules over the scheme name. _scheme_audience turns the hits into
+# AUDIENCE_* bits and _audience_reject_mask says which bits a user must not
+# see; the pipeline applies both in _filter_audience.
+# Scheme-name rules are _Rules: most names contain none of the keywords, and
+# the substring pre-check rejects those without entering the regex engine.
+_DISABILITY_SCHEME_RE = _Rule(
+    r"\bdisabilit\w+\b|\bdivyang\b|\bpwd\b|\bhandicap\w*\b|\bblind\b|\bdeaf\b"
+)
+_WIDOW_SCHEME_RE = _Rule(r"\bwidow\b|\bvidhwa\b")
+_ORPHAN_SCHEME_RE = _Rule(r"\borphan\b|\banath\b")
+# Crop insurance / Kisan schemes are hidden from non-farmers
+_FARMER_SCHEME_RE = _Rule(
+    r"\bkisan\b|\bcrop\b|\bfasal\b|\bkcc\b|\bmandi\b|\be-?nam\b|\bagriculture\b",
+    literals=("kisan", "crop", "fasal", "kcc", "mandi", "nam", "agriculture"),
+)
+_SENIOR_SCHEME_RE = _Rule(r"\bold\s*age\b|\bsenior\s*citizen\b|\bvaya\b|\bvridh\b")
+# Schemes clearly for children (Sukanya, Beti Bachao, child labor, etc.)
+_CHILD_SCHEME_RE = re.compile(
+    r"\bchild\s+labour\b|\bbalika\b|\bbeti\b|\bsukanya\b|\bgirl\s+child\b"
+)
 
 
 # --- Filter: Specific need (scholarship vs loan vs pension etc.) ---
@@ -589,6 +928,13 @@ NEED_TO_BENEFIT_TYPES = {
     "subsidy": {"subsidy", "capital subsidy"},
 }
 
+# benefit_type -> needs it serves (inverse of NEED_TO_BENEFIT_TYPES)
+BENEFIT_TYPE_TO_NEEDS = {
+    bt: frozenset(need for need, types in NEED_TO_BENEFIT_TYPES.items() if bt in types)
+    for types in NEED_TO_BENEFIT_TYPES.values()
+    for bt in types
+}
+
 NEED_TO_KEYWORDS = {
     "scholarship": [r"\bscholarship\b", r"\bfellowship\b", r"\bstipend\b", r"\bfreeship\b", r"\bfee\s+waiver\b", r"\btuition\b"],
     "loan": [r"\bloan\b", r"\bcredit\b", r"\bmudra\b"],
@@ -600,6 +946,19 @@ NEED_TO_KEYWORDS = {
 }
 
 
+# Benefit types that say nothing about which need a scheme serves
+GENERIC_BENEFIT_TYPES = frozenset({
+    "direct cash transfer", "financial assistance", "technical assistance",
+    "market access", "protection / rehabilitation", "",
+})
+
+
+# One alternation per need; the scheme text is already lowercased
+_NEED_KEYWORD_RES = {
+    need: re.compile("|".join(kws)) for need, kws in NEED_TO_KEYWORDS.items()
+}
+
+
 def _filter_by_need(scheme: dict, user_need: str) -> bool:
     """
     If user has a specific need (e.g. scholarship), filter out schemes
@@ -609,50 +968,48 @@ def _filter_by_need(scheme: dict, user_need: str) -> bool:
         return True  # No filter if no specific need
 
     # Check benefit_type field
-    benefits = scheme.get("benefits") or {}
-    if isinstance(benefits, dict):
-        benefit_type = (benefits.get("benefit_type") or "").strip().lower()
-    else:
-        benefit_type = ""
-
-    # 1. If the scheme's benefit_type matches the user's need → keep
-    matching_types = NEED_TO_BENEFIT_TYPES.get(user_need, set())
-    if matching_types and benefit_type:
-        if benefit_type in matching_types:
-            return True
-        # If benefit type is CLEARLY a different need, reject
-        # e.g. user wants scholarship but scheme is "Subsidized Loan"
-        other_needs = set()
-        for need, types in NEED_TO_BENEFIT_TYPES.items():
-            if need != user_need:
-                other_needs.update(types)
-        if benefit_type in other_needs:
-            return False
+    benefit_type = _scheme_facts(scheme).benefit_type
 
-    # 2. Check scheme text for keywords matching the need
-    text = _scheme_text(scheme)
-    name = (scheme.get("scheme_name") or "").lower()
+    # 1. If the scheme's benefit_type matches the user's need → keep;
+    #    if it is CLEARLY a different need, reject
+    #    e.g. user wants scholarship but scheme is "Subsidized Loan"
+    has_types = user_need in NEED_TO_BENEFIT_TYPES
+    if has_types and benefit_type:
+        served = BENEFIT_TYPE_TO_NEEDS.get(benefit_type)
+        if served:
+            return user_need in served
 
+    # 2. Check scheme text for keywords matching the need
     # If scheme name or text has keywords matching user's need → keep
-    need_keywords = NEED_TO_KEYWORDS.get(user_need, [])
-    if need_keywords:
-        for kw in need_keywords:
-            if re.search(kw, name, re.I) or re.search(kw, text, re.I):
-                return True
+    # (the text starts with the name, so a single scan covers both)
+    need_re = _NEED_KEYWORD_RES.get(user_need)
+    if need_re is not None and need_re.search(_scheme_facts(scheme).text):
+        return True
 
     # 3. If benefit_type is empty/generic ("Direct Cash Transfer", etc.), keep (might be relevant)
-    generic_types = {"direct cash transfer", "financial assistance", "technical assistance",
-                     "market access", "protection / rehabilitation", ""}
-    if benefit_type in generic_types:
+    if benefit_type in GENERIC_BENEFIT_TYPES:
         return True
 
     # 4. For specific needs, reject if no positive signal
-    if matching_types:
+    if has_types:
         return False
 
     return True
 
 
+# The user_ctx fields the filters read
+FILTER_FIELDS = (
+    "state", "gender", "caste_category", "age", "occupation",
+    "education_level", "disability", "family_status", "specific_need",
+)
+
+# (user filter values, candidate scheme_ids) -> (kept indices, rejection counts).
+# Every filter reads SchemeFacts, which are fixed per scheme_id, so the verdict
+# for a repeated query (same profile, same RAG hits) can be reused.
+_FILTER_RESULTS: Dict[tuple, Tuple[Tuple[int, ...], Dict[str, int]]] = {}
+_FILTER_RESULTS_MAX = 256
+
+
 def filter_schemes_for_user(
     candidates: List[Dict[str, Any]],
     user_ctx: Dict[str, str],
@@ -661,55 +1018,23 @@ def filter_schemes_for_user(
     Run ALL filters. A scheme must pass every applicable filter to survive.
     Logs what was removed and why.
     """
-    user_state = user_ctx.get("state")
-    user_gender = user_ctx.get("gender")
-    user_caste = user_ctx.get("caste_category")
-    user_age_str = user_ctx.get("age")
-    user_age = int(user_age_str) if user_age_str and user_age_str.isdigit() else None
-    user_occupation = user_ctx.get("occupation", "")
-    user_edu = user_ctx.get("education_level")
-    user_disability = user_ctx.get("disability") == "yes"
-    user_family = user_ctx.get("family_status")
-    user_need = user_ctx.get("specific_need")
-
-    filtered = []
-    reasons: Dict[str, int] = {}
-
-    for s in candidates:
-        rejected = None
-
-        if user_state and not _filter_state(s, user_state):
-            rejected = "state"
-        elif user_gender and not _filter_gender(s, user_gender):
-            rejected = "gender"
-        elif user_caste and not _filter_caste(s, user_caste):
-            rejected = "caste"
-        elif user_age is not None and not _filter_age(s, user_age):
-            rejected = "age"
-        elif user_occupation and not _filter_occupation(s, user_occupation):
-            rejected = "occupation"
-        elif user_edu and not _filter_education(s, user_edu):
-            rejected = "education_level"
-        elif not _filter_disability(s, user_disability):
-            rejected = "disability"
-        elif user_family is not None and not _filter_family_status(s, user_family):
-            rejected = "family_status"
-        elif user_occupation and not _filter_farmer_schemes(s, user_occupation):
-            rejected = "farmer_specific"
-        elif not _filter_senior_schemes(s, user_age, user_occupation):
-            rejected = "senior_specific"
-        elif user_age is not None and not _filter_child_schemes(s, user_age):
-            rejected = "child_specific"
-        elif user_need and not _filter_by_need(s, user_need):
-            rejected = "need_mismatch"
-
-        if rejected:
-            reasons[rejected] = reasons.get(rejected, 0) + 1
-        else:
-            filtered.append(s)
-
-    if reasons:
-        logger.info(
+    scheme_ids = tuple(s.get("scheme_id") for s in candidates)
+    key = None
+    if all(scheme_ids):
+        key = (tuple(user_ctx.get(f) for f in FILTER_FIELDS), scheme_ids)
+    cached = _FILTER_RESULTS.get(key) if key else None
+    if cached is None:
+        cached = _run_filters(candidates, user_ctx)
+        if key:
+            if len(_FILTER_RESULTS) >= _FILTER_RESULTS_MAX:
+                _FILTER_RESULTS.clear()
+            _FILTER_RESULTS[key] = cached
+    kept, reasons = cached
+    filtered = [candidates[i] for i in kept]
+
+    # Only build the per-filter summary when DEBUG logging is on
+    if reasons and logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
             "Filter results: %d→%d kept. Removed: %s",
             len(candidates), len(filtered),
             ", ".join(f"{k}={v}" for k, v in sorted(reasons.items())),
@@ -718,16 +1043,95 @@ def filter_schemes_for_user(
     return filtered
 
 
+def _filter_audience(scheme: dict, reject_mask: int) -> bool:
+    """The disability / family / farmer / senior / child filters as one AND."""
+    return not _scheme_facts(scheme).audience & reject_mask
+
+
+# (reason, filter(scheme, arg)) in the order they run. _filter_args supplies
+# each filter's argument; a filter whose argument is None does not apply.
+FILTER_PIPELINE: Tuple[Tuple[str, Callable[[dict, Any], bool]], ...] = (
+    ("state", _filter_state),
+    ("gender", _filter_gender),
+    ("caste", _filter_caste),
+    ("age", _filter_age),
+    ("occupation", _filter_occupation),
+    ("education_level", _filter_education),
+    ("audience", _filter_audience),
+    ("need_mismatch", _filter_by_need),
+)
+
+
+def _filter_args(user_ctx: Dict[str, str]) -> Dict[str, Any]:
+    """Per-filter argument for this user, keyed by FILTER_PIPELINE reason."""
+    age_str = user_ctx.get("age")
+    user_age = int(age_str) if age_str and age_str.isdigit() else None
+    user_occupation = user_ctx.get("occupation", "")
+    return {
+        "state": user_ctx.get("state") or None,
+        "gender": user_ctx.get("gender") or None,
+        "caste": user_ctx.get("caste_category") or None,
+        "age": user_age,
+        "occupation": user_occupation or None,
+        "education_level": user_ctx.get("education_level") or None,
+        "audience": _audience_reject_mask(
+            user_age,
+            user_occupation,
+            user_ctx.get("disability") == "yes",
+            user_ctx.get("family_status"),
+        ) or None,
+        "need_mismatch": user_ctx.get("specific_need") or None,
+    }
+
+
+def _run_filters(
+    candidates: List[Dict[str, Any]],
+    user_ctx: Dict[str, str],
+) -> Tuple[Tuple[int, ...], Dict[str, int]]:
+    """Indices of the candidates that pass every filter, and rejection counts."""
+    args = _filter_args(user_ctx)
+    active = [
+        (reason, check, args[reason])
+        for reason, check in FILTER_PIPELINE
+        if args[reason] is not None
+    ]
+
+    kept: List[int] = []
+    reasons: Dict[str, int] = {}
+
+    for i, s in enumerate(candidates):
+        for reason, check, arg in active:
+            if not check(s, arg):
+                if reason == "audience":
+                    hit = _scheme_facts(s).audience & arg
+                    reason = _AUDIENCE_REASONS[hit & -hit]  # lowest bit = first failing filter
+                reasons[reason] = reasons.get(reason, 0) + 1
+                break
+        else:
+            kept.append(i)
+
+    return tuple(kept), reasons
+
+
 # ============================================================
 # 3. ENDPOINTS
 # ============================================================
 
+# Caps concurrent RAG work (each search embeds the query over the network) so
+# it can't take every worker thread. Created at startup, inside the event loop;
+# until then anyio's default thread limiter applies.
+_rag_limiter: Optional[anyio.CapacityLimiter] = None
+
 
 @app.on_event("startup")
 async def startup_event():
     logger.info("Starting Scheme Saathi Backend...")
     logger.info("Gemini model: %s", settings.GEMINI_MODEL)
     logger.info("Total schemes: %s", rag_service.get_total_schemes())
+    for scheme in rag_service.schemes:
+        _scheme_facts(scheme)
+    global _rag_limiter
+    _rag_limiter = anyio.CapacityLimiter(settings.RAG_MAX_CONCURRENCY)
     logger.info("Ready to serve requests")
 
 
@@ -745,8 +1149,9 @@ async def root():
 @app.get("/health", response_model=HealthResponse)
 async def health():
     try:
-        gemini_ok = gemini_service.check_health()
-        rag_ok = rag_service.check_health()
+        # Both probes block (the Gemini one is a network round trip)
+        gemini_ok = await anyio.to_thread.run_sync(gemini_service.check_health)
+        rag_ok = await anyio.to_thread.run_sync(rag_service.check_health)
         total = rag_service.get_total_schemes()
         return HealthResponse(
             status="healthy" if (gemini_ok and rag_ok and total) else "degraded",
@@ -762,10 +1167,72 @@ async def health():
         raise HTTPException(status_code=500, detail=f"Health check error: {str(e)}")
 
 
+def _prepare_chat(request: ChatRequest, query: str) -> Tuple[Dict[str, str], List[str], bool, List[Dict[str, Any]]]:
+    """
+    CPU- and vector-store-bound half of /chat: extract context, run RAG and
+    filter. Returns (user_ctx, missing_fields, ready, candidates).
+    """
+    turns = _normalize_history(request.conversation_history)
+
+    # 1. Cumulative context from all user messages
+    user_ctx = _context_from_turns(turns, query)
+    completeness = context_completeness(user_ctx)
+    missing = missing_context_fields(user_ctx)
+
+    logger.debug(
+        "Context: %s | completeness=%d/%d | missing=%s",
+        user_ctx, completeness, len(CONTEXT_FIELDS), missing,
+    )
+
+    # 2. ALWAYS run RAG so scheme cards show on every reply
+    ready = is_ready_to_recommend(user_ctx)
+    candidates: List[Dict[str, Any]] = []
+
+    search_parts = [query]
+    for key in ("occupation", "state", "gender", "caste_category", "education_level"):
+        val = user_ctx.get(key)
+        if val and val.lower() not in ("unknown", "any", ""):
+            search_parts.append(val)
+    if user_ctx.get("specific_need"):
+        search_parts.append(user_ctx["specific_need"])
+    if user_ctx.get("disability") == "yes":
+        search_parts.append("disability divyang PWD")
+    if user_ctx.get("bpl") == "yes":
+        search_parts.append("BPL below poverty economically weaker")
+    search_parts.extend(content for role, content in turns[-4:] if role == "user" and content)
+    search_query = " ".join(search_parts)
+
+    raw = rag_service.search_schemes(
+        query=search_query,
+        user_context=user_ctx if ready else None,
+        top_k=50,
+    )
+    logger.debug("RAG returned %d candidates (ready=%s)", len(raw), ready)
+
+    if ready:
+        candidates = filter_schemes_for_user(raw, user_ctx)
+        logger.debug("After main filter: %d candidates", len(candidates))
+    else:
+        candidates = raw
+
+    max_schemes_chat = 20
+    if not candidates and raw:
+        candidates = raw[:max_schemes_chat]
+        logger.info("Using top %d from RAG as fallback", len(candidates))
+    else:
+        candidates = candidates[:max_schemes_chat]
+
+    logger.debug("Returning %d schemes", len(candidates))
+
+    return user_ctx, missing, ready, candidates
+
+
 @app.post("/chat", response_model=ChatResponse)
 async def chat(request: ChatRequest):
     """
     Main chat: extract context → decide gather/recommend → filter → respond.
+    Both halves are blocking (regex/RAG, then the LLM call), so they run in
+    the worker thread pool to keep the event loop free for other requests.
     """
     query = (request.message or "").strip()
     if not query:
@@ -774,72 +1241,19 @@ async def chat(request: ChatRequest):
     logger.info("Chat request: %s", query[:100])
 
     try:
-        # 1. Cumulative context from all user messages
-        user_ctx = build_cumulative_context(request.conversation_history, query)
-        completeness = context_completeness(user_ctx)
-        missing = missing_context_fields(user_ctx)
-
-        logger.info(
-            "Context: %s | completeness=%d/%d | missing=%s",
-            user_ctx, completeness, len(CONTEXT_FIELDS), missing,
-        )
-
-        # 2. ALWAYS run RAG so scheme cards show on every reply
-        ready = is_ready_to_recommend(user_ctx)
-        candidates: List[Dict[str, Any]] = []
-
-        search_parts = [query]
-        for key in ("occupation", "state", "gender", "caste_category", "education_level"):
-            val = user_ctx.get(key)
-            if val and val.lower() not in ("unknown", "any", ""):
-                search_parts.append(val)
-        if user_ctx.get("specific_need"):
-            search_parts.append(user_ctx["specific_need"])
-        if user_ctx.get("disability") == "yes":
-            search_parts.append("disability divyang PWD")
-        if user_ctx.get("bpl") == "yes":
-            search_parts.append("BPL below poverty economically weaker")
-        if request.conversation_history:
-            for m in request.conversation_history[-4:]:
-                role = getattr(m, "role", None) or (m.get("role") if isinstance(m, dict) else None)
-                content = getattr(m, "content", None) or (m.get("content", "") if isinstance(m, dict) else "")
-                if role == "user" and content:
-                    search_parts.append(content)
-        search_query = " ".join(search_parts)
-
-        raw = rag_service.search_schemes(
-            query=search_query,
-            user_context=user_ctx if ready else None,
-            top_k=50,
+        user_ctx, missing, ready, candidates = await anyio.to_thread.run_sync(
+            _prepare_chat, request, query, limiter=_rag_limiter,
         )
-        logger.info("RAG returned %d candidates (ready=%s)", len(raw), ready)
-
-        if ready:
-            candidates = filter_schemes_for_user(raw, user_ctx)
-            logger.info("After main filter: %d candidates", len(candidates))
-        else:
-            candidates = list(raw)
 
-        max_schemes_chat = 20
-        if not candidates and raw:
-            candidates = raw[:max_schemes_chat]
-            logger.info("Using top %d from RAG as fallback", len(candidates))
-        else:
-            candidates = candidates[:max_schemes_chat]
-
-        for s in candidates:
-            s["source_url"] = s.get("source_url") or ""
-            s["official_website"] = s.get("official_website") or ""
-        logger.info("Returning %d schemes", len(candidates))
-
-        reply = gemini_service.chat(
+        reply = await anyio.to_thread.run_sync(partial(
+            gemini_service.chat,
             user_message=query,
             conversation_history=request.conversation_history,
             matched_schemes=candidates if ready else None,
             user_context=user_ctx,
             missing_fields=missing,
             language=request.language,
-        )
+        ))
 
         return ChatResponse(
             message=reply,
@@ -854,42 +1268,83 @@ async def chat(request: ChatRequest):
         raise HTTPException(status_code=500, detail=f"Chat error: {str(e)}")
 
 
-@app.get("/schemes")
+def _not_modified(request: Request, response: Response) -> Optional[Response]:
+    """
+    Tag a catalogue read with the scheme-data ETag. Returns a 304 response when
+    the client's If-None-Match already matches, so the handler can skip its work.
+    """
+    etag = rag_service.catalogue_etag
+    if not etag:
+        return None
+    response.headers["ETag"] = etag
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (
+        if_none_match.strip() == "*"
+        or etag in (tag.strip() for tag in if_none_match.split(","))
+    ):
+        return Response(status_code=304, headers={"ETag": etag})
+    return None
+
+
+@app.get("/schemes", response_model=SchemeListResponse)
 async def list_schemes(
+    request: Request,
+    response: Response,
     category: Optional[str] = None,
     state: Optional[str] = None,
     limit: int = 20,
 ):
+    not_modified = _not_modified(request, response)
+    if not_modified:
+        return not_modified
     try:
-        schemes: List[Dict[str, Any]] = list(rag_service.schemes)
+        matches: Iterator[Dict[str, Any]] = iter(rag_service.schemes)
         if category:
             cat_lower = category.strip().lower()
-            schemes = [s for s in schemes if (s.get("category") or "").lower() == cat_lower]
+            matches = (s for s in matches if (s.get("category") or "").lower() == cat_lower)
         if state:
-            schemes = [s for s in schemes if _filter_state(s, state)]
-        return {"total": len(schemes[:limit]), "schemes": schemes[:limit]}
+            matches = (s for s in matches if _filter_state(s, state))
+        schemes = list(islice(matches, max(limit, 0)))
+        filters = {k: v for k, v in (("category", category), ("state", state)) if v}
+        return SchemeListResponse(
+            total=len(schemes),
+            schemes=schemes,
+            filters_applied=filters or None,
+        )
     except Exception as e:
         logger.exception("List schemes failed: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.get("/schemes/categories")
-async def list_categories():
-    return {"categories": rag_service.get_categories()}
+@app.get("/schemes/categories", response_model=CategoryListResponse)
+async def list_categories(request: Request, response: Response):
+    not_modified = _not_modified(request, response)
+    if not_modified:
+        return not_modified
+    return CategoryListResponse(categories=rag_service.get_categories())
 
 
-@app.get("/schemes/{scheme_id}")
-async def get_scheme(scheme_id: str):
+@app.get("/schemes/{scheme_id}", response_model=Dict[str, Any])
+async def get_scheme(scheme_id: str, request: Request, response: Response):
     try:
         scheme = rag_service.get_scheme_by_id(scheme_id)
-        if scheme is None:
-            raise HTTPException(status_code=404, detail="Scheme not found")
-        return scheme
-    except HTTPException:
-        raise
     except Exception as e:
         logger.exception("Get scheme failed: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
+    if scheme is None:
+        raise HTTPException(status_code=404, detail="Scheme not found")
+    # Only an existing scheme can be "not modified"
+    return _not_modified(request, response) or scheme
+
+
+def _search_and_filter(query: str, user_ctx: Dict[str, Any], top_k: int) -> List[Dict[str, Any]]:
+    """Blocking half of /search: vector search, then the eligibility filters."""
+    results = rag_service.search_schemes(
+        query=query,
+        user_context=user_ctx if user_ctx else None,
+        top_k=top_k,
+    )
+    return filter_schemes_for_user(results, user_ctx)
 
 
 @app.post("/search", response_model=SchemeSearchResponse)
@@ -904,12 +1359,10 @@ async def search_schemes(request: SchemeSearchRequest):
     if request.category:
         user_ctx["category"] = request.category
 
-    results = rag_service.search_schemes(
-        query=query,
-        user_context=user_ctx if user_ctx else None,
-        top_k=request.top_k or settings.TOP_K_SCHEMES,
+    results = await anyio.to_thread.run_sync(
+        partial(_search_and_filter, query, user_ctx, request.top_k or settings.TOP_K_SCHEMES),
+        limiter=_rag_limiter,
     )
-    results = filter_schemes_for_user(results, user_ctx)
 
     return SchemeSearchResponse(
         query=query,
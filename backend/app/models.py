@@ -185,6 +185,12 @@ class SchemeListResponse(BaseModel):
     filters_applied: Optional[Dict[str, str]] = None
 
 
+class CategoryListResponse(BaseModel):
+    """Response for listing scheme categories"""
+
+    categories: List[str]
+
+
 # ============================================================
 # SEARCH (for /search endpoint)
 # ============================================================
@@ -4,6 +4,7 @@ Builds smart system prompts based on user context + matched schemes.
 """
 
 import logging
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 from app.config import settings
@@ -82,6 +83,12 @@ class GeminiService:
     # System prompt builder
     # ------------------------------------------------------------------
 
+    # The prompt has two halves. The static rules depend only on the language,
+    # so they are byte-identical across requests and go first (before the
+    # conversation history) where provider-side prefix caching can reuse them.
+    # The turn context (profile, mode, matched schemes) changes every turn and
+    # is sent last, next to the new user message.
+
     def create_system_prompt(
         self,
         matched_schemes: Optional[List[Dict[str, Any]]] = None,
@@ -89,9 +96,20 @@ class GeminiService:
         missing_fields: Optional[List[str]] = None,
         language: str = "en",
     ) -> str:
-        ctx = user_context or {}
-        missing = missing_fields or []
-        has_schemes = bool(matched_schemes)
+        """
+        Full single-block prompt: static rules followed by the turn context.
+        chat() sends the two halves separately; this joins them for callers
+        that need one prompt string (e.g. test_gemini.py).
+        """
+        return (
+            self.static_prompt(language)
+            + "\n"
+            + self.turn_context(matched_schemes, user_context, missing_fields)
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def static_prompt(language: str = "en") -> str:
         language_instruction = LANGUAGE_INSTRUCTIONS.get(language, LANGUAGE_INSTRUCTIONS["en"])
 
         parts = [
@@ -154,31 +172,6 @@ class GeminiService:
             "- When user mentions something like 'scholarship' or 'loan' or 'marriage' — that IS their type of help. Don't ask again.",
         ]
 
-        # Full user profile
-        if ctx:
-            parts.append("")
-            parts.append("=== USER PROFILE (gathered so far — DO NOT ask again for these) ===")
-            label_map = {
-                "occupation": "Occupation",
-                "state": "State",
-                "help_type": "Type of help needed",
-                "specific_need": "Specific need",
-                "gender": "Gender",
-                "age": "Age",
-                "caste_category": "Category",
-                "education_level": "Education Level",
-                "income": "Income",
-                "bpl": "Below Poverty Line",
-                "disability": "Disability",
-                "residence": "Residence (urban/rural)",
-                "family_status": "Family Status",
-            }
-            for key, label in label_map.items():
-                val = ctx.get(key)
-                if val:
-                    parts.append(f"  {label}: {val}")
-            parts.append("=== END PROFILE ===")
-
         if language == "hi":
             parts.extend([
                 "",
@@ -207,6 +200,44 @@ class GeminiService:
                 "- income -> आय",
             ])
 
+        return f"{language_instruction}\n\n" + "\n".join(parts)
+
+    def turn_context(
+        self,
+        matched_schemes: Optional[List[Dict[str, Any]]] = None,
+        user_context: Optional[Dict[str, str]] = None,
+        missing_fields: Optional[List[str]] = None,
+    ) -> str:
+        ctx = user_context or {}
+        missing = missing_fields or []
+        has_schemes = bool(matched_schemes)
+        parts: List[str] = []
+
+        # Full user profile
+        if ctx:
+            parts.append("")
+            parts.append("=== USER PROFILE (gathered so far — DO NOT ask again for these) ===")
+            label_map = {
+                "occupation": "Occupation",
+                "state": "State",
+                "help_type": "Type of help needed",
+                "specific_need": "Specific need",
+                "gender": "Gender",
+                "age": "Age",
+                "caste_category": "Category",
+                "education_level": "Education Level",
+                "income": "Income",
+                "bpl": "Below Poverty Line",
+                "disability": "Disability",
+                "residence": "Residence (urban/rural)",
+                "family_status": "Family Status",
+            }
+            for key, label in label_map.items():
+                val = ctx.get(key)
+                if val:
+                    parts.append(f"  {label}: {val}")
+            parts.append("=== END PROFILE ===")
+
         if not has_schemes:
             # ========== GATHERING PHASE ==========
             parts.extend([
@@ -320,7 +351,7 @@ class GeminiService:
 
             parts.append("\n=== END SCHEMES ===")
 
-        return f"{language_instruction}\n\n" + "\n".join(parts)
+        return "\n".join(parts)
 
     # ------------------------------------------------------------------
     # Chat
@@ -330,13 +361,14 @@ class GeminiService:
         self,
         user_message: str,
         conversation_history: Optional[List[Any]],
-        system_prompt: str,
+        static_prompt: str,
+        turn_context: str,
     ) -> str:
-        """Call OpenAI Chat Completions (e.g. GPT 5.2) with same system prompt and history."""
+        """Call OpenAI Chat Completions (e.g. GPT 5.2): static prompt, history, then turn context."""
         from openai import OpenAI
 
         client = OpenAI(api_key=settings.OPENAI_API_KEY)
-        messages = [{"role": "system", "content": system_prompt}]
+        messages = [{"role": "system", "content": static_prompt}]
         for msg in (conversation_history or []):
             role = getattr(msg, "role", None) or (msg.get("role") if isinstance(msg, dict) else None)
             content = getattr(msg, "content", None) or (msg.get("content", "") if isinstance(msg, dict) else "")
@@ -346,6 +378,7 @@ class GeminiService:
                 messages.append({"role": "user", "content": content})
             elif role in ("assistant", "model"):
                 messages.append({"role": "assistant", "content": content})
+        messages.append({"role": "system", "content": turn_context})
         messages.append({"role": "user", "content": user_message.strip()})
 
         try:
@@ -354,7 +387,7 @@ class GeminiService:
                 messages=messages,
             )
             text = (resp.choices[0].message.content or "").strip()
-            logger.info("OpenAI response: %d chars", len(text))
+            logger.debug("OpenAI response: %d chars", len(text))
             return text or "I couldn't generate a response. Please try again."
         except Exception as e:
             logger.error("OpenAI chat failed: %s", e, exc_info=True)
@@ -372,13 +405,9 @@ class GeminiService:
         if not user_message or not user_message.strip():
             return "Please send a message so I can help you."
 
-        system_prompt = self.create_system_prompt(
-            matched_schemes=matched_schemes,
-            user_context=user_context,
-            missing_fields=missing_fields,
-            language=language,
-        )
-        logger.info(
+        static_prompt = self.static_prompt(language)
+        turn_context = self.turn_context(matched_schemes, user_context, missing_fields)
+        logger.debug(
             "Chat: msg=%d chars, history=%d, schemes=%d, ctx=%s, missing=%s",
             len(user_message), len(conversation_history or []),
             len(matched_schemes or []), user_context, missing_fields,
@@ -388,14 +417,14 @@ class GeminiService:
         if settings.OPENAI_CHAT_MODEL:
             if not (settings.OPENAI_API_KEY or "").strip():
                 return OPENAI_NO_API_KEY_MESSAGE
-            return self._chat_openai(user_message, conversation_history, system_prompt)
+            return self._chat_openai(user_message, conversation_history, static_prompt, turn_context)
 
         # Gemini
         if not self._ensure_model():
             return NO_API_KEY_MESSAGE
 
         messages = [
-            {"role": "user", "parts": [system_prompt]},
+            {"role": "user", "parts": [static_prompt]},
             {"role": "model", "parts": [MODEL_ACK]},
         ]
         for msg in (conversation_history or []):
@@ -420,14 +449,15 @@ class GeminiService:
                 history_for_api.append({"role": role, "parts": [{"text": text}]})
 
             chat_session = self._model.start_chat(history=history_for_api)
-            response = chat_session.send_message(user_message.strip())
+            # Turn context rides in the new user turn, after the cacheable prefix
+            response = chat_session.send_message([turn_context, user_message.strip()])
             text = (response.text or "").strip()
-            logger.info("Response: %d chars", len(text))
+            logger.debug("Response: %d chars", len(text))
             return text or "I couldn't generate a response. Please try again."
         except Exception as e:
             logger.error("Chat failed: %s", e, exc_info=True)
             try:
-                full_prompt = system_prompt + "\n\n"
+                full_prompt = static_prompt + "\n" + turn_context + "\n\n"
                 for msg in (conversation_history or []):
                     content = getattr(msg, "content", None) or (msg.get("content", "") if isinstance(msg, dict) else "")
                     role = getattr(msg, "role", None) or (msg.get("role", "") if isinstance(msg, dict) else "user")
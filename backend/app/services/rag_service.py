@@ -3,9 +3,11 @@ RAG service for semantic scheme search using ChromaDB.
 Loads schemes from JSON, builds vector DB, and provides search with optional user context.
 """
 
+import hashlib
 import logging
+import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from app.config import settings
 from app.utils.data_loader import (
@@ -25,11 +27,20 @@ class RAGService:
 
     COLLECTION_NAME = "government_schemes"
     BATCH_SIZE = 100
+    # Recent search results, reused while the same query + context recurs
+    SEARCH_CACHE_TTL = 60.0  # seconds
+    SEARCH_CACHE_SIZE = 2048
+    SEARCH_CACHE_MAX_TOP_K = 100
 
     def __init__(self) -> None:
         self._client = None
         self._collection = None
         self.schemes: List[Dict[str, Any]] = []
+        self._scheme_by_id: Dict[str, Dict[str, Any]] = {}
+        # (digest of query + context, top_k) -> (monotonic time, results)
+        self._search_cache: Dict[tuple, Tuple[float, Tuple[Dict[str, Any], ...]]] = {}
+        # Weak ETag for the loaded catalogue ("" = nothing loaded, don't cache)
+        self.catalogue_etag: str = ""
         self._chroma_path: Optional[Path] = None
         self._initialized = False
         self._init()
@@ -43,6 +54,11 @@ class RAGService:
             schemes_path = settings.get_schemes_path(BACKEND_ROOT)
             logger.info("Loading schemes from %s", schemes_path)
             self.schemes = load_schemes_from_json(str(schemes_path))
+            # Scheme cards always carry both link fields as strings
+            for scheme in self.schemes:
+                scheme["source_url"] = scheme.get("source_url") or ""
+                scheme["official_website"] = scheme.get("official_website") or ""
+            self._scheme_by_id = {s["scheme_id"]: s for s in self.schemes if s.get("scheme_id")}
 
             if not self.schemes:
                 logger.warning("No schemes loaded; RAG search will return empty results.")
@@ -70,12 +86,25 @@ class RAGService:
                 count = self._collection.count()
                 logger.info("Vector DB loaded with %s schemes", count)
 
+            self.catalogue_etag = self._catalogue_etag(schemes_path)
             self._initialized = True
         except Exception as e:
             logger.error("RAGService init failed: %s", e, exc_info=True)
             self.schemes = []
+            self._scheme_by_id = {}
             self._initialized = True
 
+    def _catalogue_etag(self, schemes_path: Path) -> str:
+        """
+        Build a weak ETag for the scheme catalogue. Schemes are loaded once per
+        process, so the data file's size + mtime identify what we are serving.
+        """
+        try:
+            st = schemes_path.stat()
+        except OSError:
+            return ""
+        return f'W/"{len(self.schemes):x}-{st.st_size:x}-{st.st_mtime_ns:x}"'
+
     def _initialize_vector_db(self) -> None:
         """Load scheme texts and add to ChromaDB in batches."""
         if not self.schemes or not self._collection:
@@ -204,7 +233,7 @@ class RAGService:
 
         removed = len(schemes) - len(filtered)
         if removed > 0:
-            logger.info("Hard filtered %d schemes that don't match user eligibility", removed)
+            logger.debug("Hard filtered %d schemes that don't match user eligibility", removed)
         return filtered
 
     def search_schemes(
@@ -221,6 +250,16 @@ class RAGService:
             return []
 
         top_k = top_k or settings.TOP_K_SCHEMES
+        cache_key = None
+        if top_k <= self.SEARCH_CACHE_MAX_TOP_K:
+            ctx_key = tuple(sorted((k, str(v)) for k, v in user_context.items())) if user_context else ()
+            # Keyed on a digest: queries carry recent user messages of any length
+            digest = hashlib.sha256(repr((query, ctx_key)).encode("utf-8")).digest()
+            cache_key = (digest, top_k)
+            cached = self._search_cache.get(cache_key)
+            if cached and time.monotonic() - cached[0] < self.SEARCH_CACHE_TTL:
+                return [dict(s) for s in cached[1]]
+
         enhanced_query = self._enhance_query(query, user_context)
 
         try:
@@ -242,7 +281,7 @@ class RAGService:
         if not ids or not ids[0]:
             return []
 
-        scheme_by_id = {s.get("scheme_id"): s for s in self.schemes if s.get("scheme_id")}
+        scheme_by_id = self._scheme_by_id
         threshold = settings.SIMILARITY_THRESHOLD
         out: List[Dict[str, Any]] = []
 
@@ -261,8 +300,15 @@ class RAGService:
 
         if user_context:
             out = self.filter_schemes_by_eligibility(out, user_context)
-
-        return out[:top_k]
+        out = out[:top_k]
+
+        if cache_key is not None:
+            if len(self._search_cache) >= self.SEARCH_CACHE_SIZE:
+                self._search_cache.clear()
+            self._search_cache[cache_key] = (time.monotonic(), tuple(out))
+            # Callers may annotate their results; keep the cached dicts pristine
+            out = [dict(s) for s in out]
+        return out
 
     def get_scheme_by_id(self, scheme_id: str) -> Optional[Dict[str, Any]]:
         """Return a single scheme by id or None if not found."""
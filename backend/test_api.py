@@ -204,6 +204,79 @@ def run_tests() -> bool:
         fail(str(e))
         all_passed = False
 
+    # Test 9: Conditional reads with the catalogue ETag
+    print("\n9. Conditional GET (ETag / If-None-Match)")
+    try:
+        r = client.get("/schemes?limit=1")
+        etag = r.headers.get("etag")
+        if not etag:
+            ok("skip (no catalogue ETag)")
+        else:
+            checks = [
+                ("/schemes/categories", etag, 304),
+                ("/schemes/categories", 'W/"stale"', 200),
+                ("/schemes/INVALID-ID-999", etag, 404),
+                ("/schemes/INVALID-ID-999", "*", 404),
+            ]
+            schemes = r.json().get("schemes", [])
+            if schemes and schemes[0].get("scheme_id"):
+                scheme_id = schemes[0]["scheme_id"]
+                checks += [
+                    (f"/schemes/{scheme_id}", etag, 304),
+                    (f"/schemes/{scheme_id}", 'W/"stale"', 200),
+                ]
+            etag_ok = True
+            for path, tag, expected in checks:
+                response = client.get(path, headers={"If-None-Match": tag})
+                if response.status_code != expected:
+                    fail(f"{path} If-None-Match={tag}: expected {expected}, got {response.status_code}")
+                    etag_ok = False
+                elif expected != 404 and response.headers.get("etag") != etag:
+                    fail(f"{path}: ETag {response.headers.get('etag')} != {etag}")
+                    etag_ok = False
+            all_passed = all_passed and etag_ok
+            if etag_ok:
+                ok(f"ETag={etag}: 304 on match, 200 otherwise, 404 for unknown ids")
+    except Exception as e:
+        fail(str(e))
+        all_passed = False
+
+    # Test 10: CORS preflight and simple responses
+    print("\n10. CORS (preflight + simple responses)")
+    try:
+        cors_ok = True
+        preflight = {"Origin": "http://localhost:5173", "Access-Control-Request-Method": "POST"}
+        response = client.options("/chat", headers={**preflight, "Access-Control-Request-Headers": "content-type"})
+        if (
+            response.status_code != 200
+            or response.headers.get("access-control-allow-origin") != "*"
+            or "POST" not in response.headers.get("access-control-allow-methods", "")
+            or response.headers.get("access-control-allow-headers") != "content-type"
+        ):
+            fail(f"preflight: {response.status_code} {dict(response.headers)}")
+            cors_ok = False
+        response = client.options("/chat", headers={**preflight, "Access-Control-Request-Method": "PATCH"})
+        if response.status_code != 400 or "method" not in response.text:
+            fail(f"disallowed preflight method: expected 400, got {response.status_code} {response.text!r}")
+            cors_ok = False
+        response = client.get("/", headers={"Origin": "http://localhost:5173"})
+        if response.status_code != 200 or response.headers.get("access-control-allow-origin") != "*":
+            fail(f"simple response with Origin: {response.status_code} {dict(response.headers)}")
+            cors_ok = False
+        response = client.get("/")
+        if response.status_code != 200 or "access-control-allow-origin" in response.headers:
+            fail(f"response without Origin: {response.status_code} {dict(response.headers)}")
+            cors_ok = False
+        if "Origin" not in response.headers.get("vary", ""):
+            fail(f"response without Origin should still vary on it: {dict(response.headers)}")
+            cors_ok = False
+        all_passed = all_passed and cors_ok
+        if cors_ok:
+            ok("preflight 200/400, allow-origin only on requests with Origin")
+    except Exception as e:
+        fail(str(e))
+        all_passed = False
+
     return all_passed
 
 
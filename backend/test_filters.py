@@ -5,6 +5,8 @@ Run: python test_filters.py   (from backend/)
 
 import sys
 import os
+import re
+from pathlib import Path
 sys.path.insert(0, os.path.dirname(__file__))
 
 from app.main import (
@@ -17,10 +19,6 @@ from app.main import (
     _filter_age,
     _filter_occupation,
     _filter_education,
-    _filter_disability,
-    _filter_farmer_schemes,
-    _filter_senior_schemes,
-    _filter_child_schemes,
 )
 
 PASS = 0
@@ -92,6 +90,14 @@ check("state=Delhi", ctx.get("state"), "Delhi")
 ctx = extract_context_from_text("I'm not a minority, I'm general category")
 check("caste=General", ctx.get("caste_category"), "General")
 
+# Negation only applies after "not": a plain "dalit" / "tribal" must stay
+ctx = extract_context_from_text("I am a dalit student")
+check("caste=SC (dalit)", ctx.get("caste_category"), "SC")
+ctx = extract_context_from_text("I am from a tribal family")
+check("caste=ST (tribal)", ctx.get("caste_category"), "ST")
+ctx = extract_context_from_text("I am not a tribal")
+check("no caste (not tribal)", ctx.get("caste_category"), None)
+
 # Widow
 ctx = extract_context_from_text("I am a widow from Gujarat, 50 years old")
 check("family_status=widow", ctx.get("family_status"), "widow")
@@ -118,6 +124,14 @@ check("no disability", ctx.get("disability"), None)
 ctx = extract_context_from_text("I'm not BPL, my income is decent")
 check("no bpl", ctx.get("bpl"), None)
 
+# State names match whole words (plus demonyms), not inside other words
+check("no state (goal)", extract_context_from_text("My goal is to study").get("state"), None)
+check("no state (goat)", extract_context_from_text("I rear a goat").get("state"), None)
+check("state=Goa", extract_context_from_text("I am from goa").get("state"), "Goa")
+check("state=Punjab (punjabi)", extract_context_from_text("I'm a Punjabi farmer").get("state"), "Punjab")
+check("state=Goa (goan)", extract_context_from_text("a goan fisherman").get("state"), "Goa")
+check("state=Assam (assamese)", extract_context_from_text("I speak assamese").get("state"), "Assam")
+
 
 # ========================
 # CUMULATIVE CONTEXT TEST
@@ -213,28 +227,38 @@ check("edu: general kept for higher ed", _filter_education(general, "higher"), T
 check("edu: post-matric rejected for school", _filter_education(post_matric, "school"), False)
 check("edu: pre-matric kept for school", _filter_education(pre_matric, "school"), True)
 
+# Audience filters (disability / widow / farmer / senior / child) run as one
+# bitmask check inside the pipeline, so test them through it
+def kept(scheme, **user_ctx):
+    return bool(filter_schemes_for_user([scheme], user_ctx))
+
 # Disability tests
 disability_scheme = make_scheme(name="Scholarship for Students with Disabilities")
 normal_scheme = make_scheme(name="National Merit Scholarship")
-check("disability scheme rejected for non-disabled", _filter_disability(disability_scheme, False), False)
-check("disability scheme kept for disabled", _filter_disability(disability_scheme, True), True)
-check("normal scheme kept for non-disabled", _filter_disability(normal_scheme, False), True)
+check("disability scheme rejected for non-disabled", kept(disability_scheme), False)
+check("disability scheme kept for disabled", kept(disability_scheme, disability="yes"), True)
+check("normal scheme kept for non-disabled", kept(normal_scheme), True)
+
+# Widow scheme filter
+widow_scheme = make_scheme(name="Widow Pension Scheme")
+check("widow scheme rejected for pregnant user", kept(widow_scheme, family_status="pregnant"), False)
+check("widow scheme kept for widow", kept(widow_scheme, family_status="widow"), True)
+check("widow scheme kept when family status unknown", kept(widow_scheme), True)
 
 # Farmer scheme filter
 kisan_scheme = make_scheme(name="PM-KISAN Samman Nidhi")
-check("kisan rejected for student", _filter_farmer_schemes(kisan_scheme, "student"), False)
-check("kisan kept for farmer", _filter_farmer_schemes(kisan_scheme, "farmer"), True)
+check("kisan rejected for student", kept(kisan_scheme, occupation="student"), False)
+check("kisan kept for farmer", kept(kisan_scheme, occupation="farmer"), True)
 
 # Senior citizen filter
 senior_scheme = make_scheme(name="Indira Gandhi Old Age Pension")
-check("senior scheme rejected for 22yr student", _filter_senior_schemes(senior_scheme, 22, "student"), False)
-check("senior scheme kept for 67yr senior", _filter_senior_schemes(senior_scheme, 67, "senior citizen"), True)
-check("senior scheme kept for 60yr worker", _filter_senior_schemes(senior_scheme, 60, "worker"), True)
+check("senior scheme rejected for 22yr student", kept(senior_scheme, age="22", occupation="student"), False)
+check("senior scheme kept for 67yr senior", kept(senior_scheme, age="67", occupation="senior citizen"), True)
+check("senior scheme kept for 60yr worker", kept(senior_scheme, age="60", occupation="worker"), True)
 
 # Child scheme filter
 child_scheme = make_scheme(name="Sukanya Samriddhi Yojana", elig_text="for girl child below 10")
-check("child scheme rejected for 30yr adult", _filter_child_schemes(child_scheme, 30), False)
-
+check("child scheme rejected for 30yr adult", kept(child_scheme, age="30"), False)
 
 # ========================
 # FULL PIPELINE TEST
@@ -279,6 +303,59 @@ check("pipeline: Old Age Pension removed", "Old Age Pension" in result_names, Fa
 check("pipeline: Disability removed", "Scholarship for Students with Disabilities" in result_names, False)
 check("pipeline: Women Entrepreneur removed", "Women Entrepreneur Loan" in result_names, False)
 
+# ========================
+# LITERAL PRE-CHECK TESTS
+# ========================
+print()
+print("=" * 60)
+print("LITERAL PRE-CHECK TESTS")
+print("=" * 60)
+
+# Every _Rule's substring pre-check must agree with its plain regex; a wrongly
+# derived literal would otherwise skip a rule silently.
+import app.main as main_module
+from app.main import _Rule, _scheme_facts
+from app.config import settings
+from app.utils.data_loader import load_schemes_from_json
+
+
+def collect_rules(value, found):
+    if isinstance(value, _Rule):
+        found.append(value)
+    elif isinstance(value, (tuple, list)):
+        for item in value:
+            collect_rules(item, found)
+    elif isinstance(value, dict):
+        for item in value.values():
+            collect_rules(item, found)
+    return found
+
+
+rules = []
+for name, value in vars(main_module).items():
+    if name.startswith("_") and name.endswith(("_RE", "_RES")):
+        collect_rules(value, rules)
+check("rules found", len(rules) > 50, True)
+
+# Texts are lowercased before matching, so an uppercase literal never matches
+uppercase = [r.pattern.pattern for r in rules if re.search(r"(?<!\\)[A-Z]", r.pattern.pattern)]
+check("no uppercase literals in patterns", uppercase, [])
+check("pre-check literals lowercase", [r.literals for r in rules if r.literals and any(l != l.lower() for l in r.literals)], [])
+
+catalogue = load_schemes_from_json(str(settings.get_schemes_path(Path(__file__).resolve().parent)))
+texts = [_scheme_facts(s).text for s in catalogue] + [
+    "i'm a 45 year old farmer in bihar", "age is 30", "i am 21", "my income is 2 lakh per year",
+    "i am a person with disability, divyang", "we are a bpl family from rural jharkhand",
+    "vidhwa pension yojana", "anath bal ashram", "e-nam mandi portal", "vridh pension", "kcc loan",
+]
+mismatches = [
+    (r.pattern.pattern, t[:60])
+    for r in rules if r.literals is not None
+    for t in texts
+    if (r.search(t) is None) != (r.pattern.search(t) is None)
+]
+check(f"_Rule.search agrees with the regex on {len(texts)} texts", mismatches[:5], [])
+
 print()
 print("=" * 60)
 print(f"RESULTS: {PASS} passed, {FAIL} failed out of {PASS + FAIL}")
@@ -128,6 +128,24 @@ try:
 except Exception as e:
     print(f"   [FAIL] {e}")
 
+# Test 9: Static prompt is independent of the turn (provider prefix caching relies on it)
+print("\n9. Static prompt unchanged by profile/schemes...")
+try:
+    for lang in ("en", "hi"):
+        static = gemini_service.static_prompt(lang)
+        full = gemini_service.create_system_prompt(
+            [{"scheme_name": "TEST-SCHEME-XYZ", "benefits": {"summary": "Rs 1"}}],
+            {"occupation": "test-occupation-xyz", "state": "Bihar"},
+            ["gender", "age"],
+            language=lang,
+        )
+        assert full.startswith(static + "\n"), f"{lang}: full prompt does not start with the static prompt"
+        assert "-xyz" not in static.lower(), f"{lang}: static prompt carries turn data"
+        assert gemini_service.static_prompt(lang) == static
+    print("   [OK] static_prompt(lang) is the same prefix for every turn")
+except Exception as e:
+    print(f"   [FAIL] {e}")
+
 print("\n" + "=" * 60)
 print("Gemini service test complete!")
 print("=" * 60)